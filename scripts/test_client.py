@@ -5,12 +5,19 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import heapq
 import json
 import math
 import sys
 from pathlib import Path
+from typing import Any, Coroutine
 
-from bay_wheels import AuthenticationError, BayWheelsClient, TokenInfo
+from bay_wheels import (
+    AuthenticationError,
+    BayWheelsClient,
+    EmailVerificationRequiredError,
+    TokenInfo,
+)
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "bay_wheels" / "config.json"
 
@@ -75,12 +82,38 @@ def clear_token(config_path: Path) -> None:
         config_path.unlink()
 
 
+async def aload_token(config_path: Path) -> TokenInfo | None:
+    """Load token from config file without blocking the event loop.
+
+    Prefer this over load_token() inside coroutines.
+
+    Args:
+        config_path: Path to the config file.
+
+    Returns:
+        The loaded token info, or None if not found or invalid.
+    """
+    return await asyncio.to_thread(load_token, config_path)
+
+
+async def asave_token(token_info: TokenInfo, config_path: Path) -> None:
+    """Save token to config file without blocking the event loop.
+
+    Prefer this over save_token() inside coroutines.
+
+    Args:
+        token_info: The token info to save.
+        config_path: Path to the config file.
+    """
+    await asyncio.to_thread(save_token, token_info, config_path)
+
+
 async def cmd_login(args: argparse.Namespace) -> int:
     """Handle the login command."""
     config_path = Path(args.config)
 
     # Check for existing token
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
     if token_info is not None:
         print(f"Already logged in (token: {token_info.access_token[:20]}...)")
         print("Use --force to re-authenticate.")
@@ -105,16 +138,12 @@ async def cmd_login(args: argparse.Namespace) -> int:
             # First attempt without email
             try:
                 token_info = await client.login(phone, code)
-            except AuthenticationError as e:
-                # Check if email verification is required
-                if "Email verification required" in str(e):
-                    print(f"\n{e}")
-                    email = input("Enter your email address: ").strip()
-                    token_info = await client.login(phone, code, email=email)
-                else:
-                    raise
-
-            save_token(token_info, config_path)
+            except EmailVerificationRequiredError as e:
+                print(f"\n{e}")
+                email = input("Enter your email address: ").strip()
+                token_info = await client.login(phone, code, email=email)
+
+            await asave_token(token_info, config_path)
             print(f"Logged in successfully! Token saved to {config_path}")
             return 0
 
@@ -126,7 +155,7 @@ async def cmd_login(args: argparse.Namespace) -> int:
 async def cmd_list_stations(args: argparse.Namespace) -> int:
     """Handle the list-stations command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in. Run 'login' first.")
@@ -152,39 +181,43 @@ async def cmd_list_stations(args: argparse.Namespace) -> int:
                     # Station coordinates are (lon, lat)
                     dist = haversine_distance(user_lat, user_lon, s.coordinates[1], s.coordinates[0])
                     stations_with_dist.append((s, dist))
-                stations_with_dist.sort(key=lambda x: x[1])
 
                 limit = args.n if args.n else 20
-                print(f"Nearest {limit} stations:")
-                print("-" * 135)
-                print(f"{'Name':<40} {'ID':<52} {'Dist':>7} {'E-Bikes':>8} {'Bikes':>8} {'Docks':>8}")
-                print("-" * 135)
-
-                for station, dist in stations_with_dist[:limit]:
+                nearest = heapq.nsmallest(limit, stations_with_dist, key=lambda x: x[1])
+                lines = [
+                    f"Nearest {limit} stations:",
+                    "-" * 135,
+                    f"{'Name':<40} {'ID':<52} {'Dist':>7} {'E-Bikes':>8} {'Bikes':>8} {'Docks':>8}",
+                    "-" * 135,
+                ]
+                for station, dist in nearest:
                     name = (station.name or "Unknown")[:39]
-                    print(
+                    lines.append(
                         f"{name:<40} {station.id:<52} {dist:>6.2f}m {station.ebikes_available:>8} "
                         f"{station.bikes_available:>8} {station.docks_available:>8}"
                     )
             else:
-                # Sort by total bikes available
-                stations.sort(
-                    key=lambda s: s.ebikes_available + s.bikes_available, reverse=True
-                )
-
+                # Pick the stations with the most bikes available
                 limit = args.n if args.n else 20
-                print(f"Top {limit} stations with bikes available:")
-                print("-" * 127)
-                print(f"{'Name':<40} {'ID':<52} {'E-Bikes':>8} {'Bikes':>8} {'Docks':>8}")
-                print("-" * 127)
-
-                for station in stations[:limit]:
+                top = heapq.nlargest(
+                    limit, stations, key=lambda s: s.ebikes_available + s.bikes_available
+                )
+                lines = [
+                    f"Top {limit} stations with bikes available:",
+                    "-" * 127,
+                    f"{'Name':<40} {'ID':<52} {'E-Bikes':>8} {'Bikes':>8} {'Docks':>8}",
+                    "-" * 127,
+                ]
+                for station in top:
                     name = (station.name or "Unknown")[:39]
-                    print(
+                    lines.append(
                         f"{name:<40} {station.id:<52} {station.ebikes_available:>8} "
                         f"{station.bikes_available:>8} {station.docks_available:>8}"
                     )
 
+            # Write the whole table at once rather than a print() per row
+            sys.stdout.write("\n".join(lines) + "\n")
+
             return 0
 
         except AuthenticationError as e:
@@ -199,7 +232,7 @@ async def cmd_list_stations(args: argparse.Namespace) -> int:
 async def cmd_reserve(args: argparse.Namespace) -> int:
     """Handle the reserve command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in. Run 'login' first.")
@@ -231,7 +264,7 @@ async def cmd_reserve(args: argparse.Namespace) -> int:
 async def cmd_cancel(args: argparse.Namespace) -> int:
     """Handle the cancel command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in. Run 'login' first.")
@@ -256,7 +289,7 @@ async def cmd_cancel(args: argparse.Namespace) -> int:
 async def cmd_station_bikes(args: argparse.Namespace) -> int:
     """Handle the station-bikes command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in. Run 'login' first.")
@@ -291,7 +324,7 @@ async def cmd_station_bikes(args: argparse.Namespace) -> int:
 async def cmd_refresh(args: argparse.Namespace) -> int:
     """Handle the refresh command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in. Run 'login' first.")
@@ -313,7 +346,7 @@ async def cmd_refresh(args: argparse.Namespace) -> int:
         try:
             print("\nRefreshing token...")
             new_token_info = await client.refresh_token()
-            save_token(new_token_info, config_path)
+            await asave_token(new_token_info, config_path)
             print(f"Token refreshed successfully!")
             print(f"New token: {new_token_info.access_token[:20]}...")
             if new_token_info.expires_in_seconds is not None:
@@ -331,7 +364,7 @@ async def cmd_refresh(args: argparse.Namespace) -> int:
 async def cmd_status(args: argparse.Namespace) -> int:
     """Handle the status command."""
     config_path = Path(args.config)
-    token_info = load_token(config_path)
+    token_info = await aload_token(config_path)
 
     if token_info is None:
         print("Not logged in.")
@@ -351,6 +384,15 @@ async def cmd_status(args: argparse.Namespace) -> int:
     return 0
 
 
+def run(coro: Coroutine[Any, Any, int]) -> int:
+    """Run a command coroutine, using uvloop's event loop when it is installed."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -417,19 +459,19 @@ def main() -> int:
 
     # Dispatch to appropriate command handler
     if args.command == "login":
-        return asyncio.run(cmd_login(args))
+        return run(cmd_login(args))
     elif args.command == "list-stations":
-        return asyncio.run(cmd_list_stations(args))
+        return run(cmd_list_stations(args))
     elif args.command == "reserve":
-        return asyncio.run(cmd_reserve(args))
+        return run(cmd_reserve(args))
     elif args.command == "cancel":
-        return asyncio.run(cmd_cancel(args))
+        return run(cmd_cancel(args))
     elif args.command == "station-bikes":
-        return asyncio.run(cmd_station_bikes(args))
+        return run(cmd_station_bikes(args))
     elif args.command == "refresh":
-        return asyncio.run(cmd_refresh(args))
+        return run(cmd_refresh(args))
     elif args.command == "status":
-        return asyncio.run(cmd_status(args))
+        return run(cmd_status(args))
     else:
         parser.print_help()
         return 1
@@ -1,13 +1,19 @@
 """Bay Wheels Python client library."""
 
 from .client import BayWheelsClient
-from .exceptions import AuthenticationError, BayWheelsError, ReservationError
+from .exceptions import (
+    AuthenticationError,
+    BayWheelsError,
+    EmailVerificationRequiredError,
+    ReservationError,
+)
 from .models import Reservation, Station, StationBike, TokenInfo
 
 __all__ = [
     "BayWheelsClient",
     "AuthenticationError",
     "BayWheelsError",
+    "EmailVerificationRequiredError",
     "ReservationError",
     "Reservation",
     "Station",
@@ -11,7 +11,7 @@ from urllib.parse import urlencode
 
 from curl_cffi.requests import AsyncSession
 
-from .exceptions import AuthenticationError
+from .exceptions import AuthenticationError, EmailVerificationRequiredError
 from .models import TokenInfo
 
 if TYPE_CHECKING:
@@ -37,6 +37,7 @@ class AuthManager:
         """
         self._session = session
         self._token_info: TokenInfo | None = None
+        self._authorization_header: str | None = None
 
         # Generate persistent IDs for this session (app uses same IDs across requests)
         self._device_id = str(uuid.uuid4()).upper()
@@ -55,9 +56,15 @@ class AuthManager:
         """Get the current token info."""
         return self._token_info
 
+    @property
+    def authorization_header(self) -> str | None:
+        """Get the Authorization header value for the current token, if available."""
+        return self._authorization_header
+
     def set_token(self, token_info: TokenInfo) -> None:
         """Set the current token info."""
         self._token_info = token_info
+        self._authorization_header = f"Bearer {token_info.access_token}"
 
     def _get_basic_auth(self) -> str:
         """Get Basic auth header from client credentials."""
@@ -188,9 +195,9 @@ class AuthManager:
             The token info containing the access token.
 
         Raises:
-            AuthenticationError: If login fails. If email verification is required,
-                the error message will contain "challenge_required" and the masked
-                email hint.
+            EmailVerificationRequiredError: If email verification is required. The
+                error message contains the masked email hint.
+            AuthenticationError: If login fails for any other reason.
         """
         headers = self._get_common_headers()
         headers.update({
@@ -227,7 +234,7 @@ class AuthManager:
                     for challenge in challenges:
                         if challenge.get("identifier") == "email_match":
                             email_hint = challenge.get("data", "")
-                            raise AuthenticationError(
+                            raise EmailVerificationRequiredError(
                                 f"Email verification required. "
                                 f"Please provide the email matching: {email_hint}"
                             )
@@ -251,14 +258,15 @@ class AuthManager:
         expires_in = data.get("expires_in")
         expires_at = time.time() + expires_in if expires_in else None
 
-        self._token_info = TokenInfo(
+        token_info = TokenInfo(
             access_token=data["access_token"],
             refresh_token=data.get("refresh_token"),
             expires_at=expires_at,
             token_type=data.get("token_type", "Bearer"),
         )
+        self.set_token(token_info)
 
-        return self._token_info
+        return token_info
 
     async def refresh_token(self) -> TokenInfo:
         """Refresh the access token using the refresh token.
@@ -304,11 +312,12 @@ class AuthManager:
         expires_in = data.get("expires_in")
         expires_at = time.time() + expires_in if expires_in else None
 
-        self._token_info = TokenInfo(
+        token_info = TokenInfo(
             access_token=data["access_token"],
             refresh_token=data.get("refresh_token", self._token_info.refresh_token),
             expires_at=expires_at,
             token_type=data.get("token_type", "Bearer"),
         )
+        self.set_token(token_info)
 
-        return self._token_info
+        return token_info
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
+import orjson
+from curl_cffi import CurlECode, CurlHttpVersion
 from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.errors import RequestsError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from curl_cffi.requests import Response
     from typing_extensions import Self
 
 from .auth import USER_AGENT, AuthManager
@@ -15,6 +23,30 @@ from .exceptions import AuthenticationError, BayWheelsError, ReservationError
 from .models import Reservation, Station, StationBike, TokenInfo
 
 BASE_URL = "https://api.lyft.com"
+INVENTORY_URL = f"{BASE_URL}/v1/lbsbff/map/inventory"
+
+# How long a fetched station inventory is served from memory before re-fetching
+STATIONS_CACHE_TTL = 5.0
+
+# Transient failures are retried with exponential backoff
+RETRY_ATTEMPTS = 3
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# Errors raised before a request reaches the server, so even non-idempotent
+# requests can safely be re-sent
+CONNECT_ERROR_CODES = frozenset({
+    CurlECode.COULDNT_RESOLVE_PROXY,
+    CurlECode.COULDNT_RESOLVE_HOST,
+    CurlECode.COULDNT_CONNECT,
+})
+
+# Maximum number of distinct (endpoint, body, parser) results kept in memory
+RESPONSE_CACHE_SIZE = 32
+
+
+def _new_session() -> AsyncSession:
+    """Create an HTTP session that multiplexes concurrent requests over HTTP/2."""
+    return AsyncSession(impersonate="chrome", http_version=CurlHttpVersion.V2_0)
 
 
 class BayWheelsClient:
@@ -24,16 +56,35 @@ class BayWheelsClient:
         self,
         access_token: str | None = None,
         token_info: TokenInfo | None = None,
+        session: AsyncSession | None = None,
     ) -> None:
         """Initialize the client.
 
         Args:
             access_token: Optional access token for authenticated requests.
             token_info: Optional full token info (takes precedence over access_token).
+            session: Optional HTTP session to use, e.g. one shared between clients
+                to reuse connections. A session passed in is not closed when the
+                client is closed, and must only be used within one event loop.
         """
-        self._session = AsyncSession(impersonate="chrome")
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        else:
+            self._session = _new_session()
+            self._owns_session = True
         self._auth = AuthManager(self._session)
-        self._owns_session = True
+
+        # Headers that don't change between requests; only the timestamp and
+        # authorization are filled in per call
+        self._base_headers = {
+            **self._auth._get_common_headers(),
+            "content-type": "application/json",
+        }
+
+        # Parsed POST responses keyed on (url, body, parser): (fetched_at, etag, result)
+        self._resp_cache: dict[tuple[str, bytes, object], tuple[float, str | None, Any]] = {}
+        self._stations_ttl = STATIONS_CACHE_TTL
 
         if token_info is not None:
             self._auth.set_token(token_info)
@@ -81,16 +132,62 @@ class BayWheelsClient:
         Returns:
             Dictionary of headers.
         """
-        headers = self._auth._get_common_headers()
-        headers.update({
-            "content-type": "application/json",
-        })
+        headers = self._base_headers.copy()
+        headers["x-timestamp-ms"] = str(int(time.time() * 1000))
 
-        if authenticated and self._auth.access_token:
-            headers["authorization"] = f"Bearer {self._auth.access_token}"
+        authorization = self._auth.authorization_header
+        if authenticated and authorization:
+            headers["authorization"] = authorization
 
         return headers
 
+    async def _post_with_retry(
+        self,
+        url: str,
+        data: bytes,
+        extra_headers: dict[str, str] | None = None,
+        idempotent: bool = True,
+    ) -> Response:
+        """POST a request, retrying transient failures.
+
+        Idempotent requests are retried on network errors and 502/503/504
+        responses. Other requests are only retried when the connection could not
+        be established, since the server may already have acted on them.
+
+        Args:
+            url: The endpoint to POST to.
+            data: The encoded request body.
+            extra_headers: Headers to send on top of the common request headers,
+                which are rebuilt for each attempt so the timestamp stays current.
+            idempotent: Whether the request is safe to send more than once.
+
+        Returns:
+            The response. After the last attempt this may still be a 5xx.
+
+        Raises:
+            RequestsError: If the request fails with a network error that is not
+                retried, or the last attempt fails.
+        """
+        def build_headers() -> dict[str, str]:
+            headers = self._get_headers()
+            if extra_headers:
+                headers.update(extra_headers)
+            return headers
+
+        for attempt in range(RETRY_ATTEMPTS - 1):
+            try:
+                response = await self._session.post(url, data=data, headers=build_headers())
+            except RequestsError as e:
+                if not idempotent and e.code not in CONNECT_ERROR_CODES:
+                    raise
+            else:
+                if not idempotent or response.status_code not in RETRY_STATUS_CODES:
+                    return response
+
+            await asyncio.sleep(2**attempt * 0.1 + random.random() * 0.05)
+
+        return await self._session.post(url, data=data, headers=build_headers())
+
     # Authentication methods
 
     async def request_code(self, phone_number: str) -> None:
@@ -121,7 +218,8 @@ class BayWheelsClient:
             The token info containing the access token.
 
         Raises:
-            AuthenticationError: If login fails or email verification is needed.
+            EmailVerificationRequiredError: If email verification is needed.
+            AuthenticationError: If login fails.
         """
         return await self._auth.login(phone_number, code, email=email)
 
@@ -150,7 +248,7 @@ class BayWheelsClient:
             )
             if response.status_code != 200:
                 return {}
-            data = response.json()
+            data = orjson.loads(response.content)
             return {
                 s["station_id"]: s["name"]
                 for s in data.get("data", {}).get("stations", [])
@@ -168,12 +266,95 @@ class BayWheelsClient:
             return parts[2]
         return None
 
+    async def _cached_post(
+        self,
+        url: str,
+        body: dict[str, Any],
+        ttl: float,
+        parse: Callable[[Response], Awaitable[Any]],
+    ) -> Any:
+        """POST a JSON body, serving identical requests from memory for a while.
+
+        Within the TTL the cached result is returned without a request. After
+        that the request is revalidated with the stored ETag, and a 304 reuses
+        the cached result without calling parse.
+
+        Args:
+            url: The endpoint to POST to.
+            body: The JSON request body.
+            ttl: Seconds a cached result is served without contacting the server.
+            parse: Turns a response into the result to cache. Should raise on
+                error responses so that they aren't cached. Results from
+                different parsers of the same request are cached separately.
+
+        Returns:
+            The (possibly cached) parsed result.
+        """
+        payload = orjson.dumps(body)
+        key = (url, payload, parse)
+
+        cached = self._resp_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[2]
+
+        extra_headers: dict[str, str] = {}
+        if cached is not None and cached[1] is not None:
+            extra_headers["if-none-match"] = cached[1]
+
+        response = await self._post_with_retry(url, payload, extra_headers)
+
+        if response.status_code == 304 and cached is not None:
+            # Unchanged since the last fetch
+            result = cached[2]
+            etag = cached[1]
+        else:
+            result = await parse(response)
+            etag = response.headers.get("etag")
+
+        # Re-insert so the dict stays ordered from least to most recently fetched
+        self._resp_cache.pop(key, None)
+        self._resp_cache[key] = (time.monotonic(), etag, result)
+        if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+            del self._resp_cache[next(iter(self._resp_cache))]
+
+        return result
+
     async def list_stations(self) -> list[Station]:
         """Get all stations with current availability.
 
+        Results are cached in memory for a few seconds, and the inventory is
+        re-validated with the server's ETag so unchanged data isn't re-parsed.
+
         Returns:
             List of stations with bike availability info.
 
+        Raises:
+            BayWheelsError: If the request fails.
+            AuthenticationError: If not authenticated.
+        """
+        # Hand out copies so callers can't modify the cached stations
+        stations, _ = await self._get_stations()
+        return [station.model_copy() for station in stations]
+
+    async def _get_stations(self) -> tuple[list[Station], dict[str, Station]]:
+        """Get all stations and an index of them by ID, cached when fresh."""
+        if not self.is_authenticated:
+            raise AuthenticationError("Must be authenticated to list stations")
+
+        return await self._cached_post(
+            INVENTORY_URL, {}, self._stations_ttl, self._parse_stations
+        )
+
+    async def list_stations_summary(self) -> list[tuple[str, int, int, int]]:
+        """Get availability for all stations without building Station objects.
+
+        Cheaper than list_stations() when only IDs and counts are needed, e.g.
+        when polling for availability changes. Station names are not fetched.
+
+        Returns:
+            List of (station_id, ebikes_available, bikes_available,
+            docks_available) tuples.
+
         Raises:
             BayWheelsError: If the request fails.
             AuthenticationError: If not authenticated.
@@ -181,12 +362,51 @@ class BayWheelsClient:
         if not self.is_authenticated:
             raise AuthenticationError("Must be authenticated to list stations")
 
-        response = await self._session.post(
-            f"{BASE_URL}/v1/lbsbff/map/inventory",
-            json={},
-            headers=self._get_headers(),
+        summary = await self._cached_post(
+            INVENTORY_URL, {}, self._stations_ttl, self._parse_stations_summary
         )
+        return list(summary)
+
+    async def watch_stations(
+        self, interval: float = 6.0
+    ) -> AsyncIterator[dict[str, Station | None]]:
+        """Poll station availability and yield the stations that changed.
+
+        The first iteration yields every station; later iterations only yield
+        stations whose data differs from the previous poll, and map stations
+        that disappeared from the inventory to None. Polls with no changes
+        yield nothing.
+
+        Args:
+            interval: Seconds to wait between polls. The default is a little
+                longer than the inventory cache TTL so every poll refreshes.
+
+        Yields:
+            Dict mapping station ID to the updated station, or None if removed.
+
+        Raises:
+            BayWheelsError: If a request fails.
+            AuthenticationError: If not authenticated.
+        """
+        previous: dict[str, Station] = {}
+        while True:
+            current = {station.id: station for station in await self.list_stations()}
+            changed: dict[str, Station | None] = {
+                station_id: station
+                for station_id, station in current.items()
+                if previous.get(station_id) != station
+            }
+            for station_id in previous.keys() - current.keys():
+                changed[station_id] = None
+            previous = current
+
+            if changed:
+                yield changed
+
+            await asyncio.sleep(interval)
 
+    def _parse_inventory(self, response: Response) -> list[dict[str, Any]]:
+        """Parse an inventory response into its station GeoJSON features."""
         if response.status_code == 403:
             raise AuthenticationError("Access denied - token may be expired")
 
@@ -195,36 +415,59 @@ class BayWheelsClient:
 
         # Parse response - GeoJSON may be nested in map_inventory_json field
         try:
-            outer_data = response.json()
+            outer_data = orjson.loads(response.content)
 
             # Check if GeoJSON is nested inside map_inventory_json
             if "map_inventory_json" in outer_data:
                 # It's an escaped JSON string, parse it
-                data = json.loads(outer_data["map_inventory_json"])
+                data = orjson.loads(outer_data["map_inventory_json"])
             else:
                 data = outer_data
-        except (json.JSONDecodeError, ValueError) as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             raise BayWheelsError(f"Failed to parse station data: {e}")
 
         if data.get("type") != "FeatureCollection":
             raise BayWheelsError(f"Unexpected response format: {data.get('type')}")
 
+        # map_item_type=1 are stations, map_item_type=2 are individual bikes
+        return [
+            feature
+            for feature in data.get("features", [])
+            if feature.get("properties", {}).get("map_item_type") == 1
+        ]
+
+    async def _parse_stations(
+        self, response: Response
+    ) -> tuple[list[Station], dict[str, Station]]:
+        """Parse an inventory response into stations and an index of them by ID."""
+        features = self._parse_inventory(response)
+
         # Fetch station names from GBFS
         gbfs_names = await self._fetch_gbfs_station_names()
 
-        stations = []
-        for feature in data.get("features", []):
-            props = feature.get("properties", {})
-            # map_item_type=1 are stations, map_item_type=2 are individual bikes
-            if props.get("map_item_type") == 1:
-                station = Station.from_geojson_feature(feature)
-                # Look up name from GBFS using the UUID portion of the ID
-                uuid = self._extract_station_uuid(station.id)
-                if uuid and uuid in gbfs_names:
-                    station.name = gbfs_names[uuid]
-                stations.append(station)
-
-        return stations
+        stations = [Station.from_geojson_feature(feature) for feature in features]
+        for station in stations:
+            # Look up name from GBFS using the UUID portion of the ID
+            uuid = self._extract_station_uuid(station.id)
+            if uuid and uuid in gbfs_names:
+                station.name = gbfs_names[uuid]
+
+        return stations, {station.id: station for station in stations}
+
+    async def _parse_stations_summary(
+        self, response: Response
+    ) -> list[tuple[str, int, int, int]]:
+        """Parse an inventory response into (id, ebikes, bikes, docks) tuples."""
+        summary = []
+        for feature in self._parse_inventory(response):
+            props = feature["properties"]
+            summary.append((
+                props.get("map_item_id", ""),
+                props.get("ebikes_available", 0),
+                props.get("bikes_available", 0),
+                props.get("docks_available", 0),
+            ))
+        return summary
 
     async def get_station(self, station_id: str) -> Station | None:
         """Get a specific station by ID.
@@ -239,11 +482,9 @@ class BayWheelsClient:
             BayWheelsError: If the request fails.
             AuthenticationError: If not authenticated.
         """
-        stations = await self.list_stations()
-        for station in stations:
-            if station.id == station_id:
-                return station
-        return None
+        _, stations_by_id = await self._get_stations()
+        station = stations_by_id.get(station_id)
+        return station.model_copy() if station is not None else None
 
     async def get_station_bikes(self, station_id: str) -> list[StationBike]:
         """Get e-bikes at a station with their estimated range.
@@ -276,10 +517,9 @@ class BayWheelsClient:
             },
         }
 
-        response = await self._session.post(
+        response = await self._post_with_retry(
             f"{BASE_URL}/v1/lbsbff/panel/pre-ride-station",
-            json=request_body,
-            headers=self._get_headers(),
+            orjson.dumps(request_body),
         )
 
         if response.status_code == 403:
@@ -290,8 +530,8 @@ class BayWheelsClient:
 
         # Parse JSON response
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise BayWheelsError(f"Failed to parse response: {e}")
 
         # Extract bike info from response
@@ -343,14 +583,60 @@ class BayWheelsClient:
         if not self.is_authenticated:
             raise AuthenticationError("Must be authenticated to create reservations")
 
-        response = await self._session.post(
+        return await self._reserve(station_id, bike_type)
+
+    async def create_reservations(
+        self,
+        station_ids: list[str],
+        bike_type: str = "ebike",
+        concurrency: int = 8,
+    ) -> list[Reservation | BaseException]:
+        """Create reservations at several stations concurrently.
+
+        Args:
+            station_ids: The station IDs to reserve bikes from.
+            bike_type: Type of bike to reserve ("ebike" or "bike").
+            concurrency: Maximum number of reservation requests in flight at once.
+
+        Returns:
+            One entry per station ID, in the same order: the reservation, or the
+            exception raised while trying to create it.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            AuthenticationError: If not authenticated.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        if not self.is_authenticated:
+            raise AuthenticationError("Must be authenticated to create reservations")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def reserve(station_id: str) -> Reservation:
+            async with semaphore:
+                return await self._reserve(station_id, bike_type)
+
+        return await asyncio.gather(
+            *(reserve(station_id) for station_id in station_ids),
+            return_exceptions=True,
+        )
+
+    async def _reserve(
+        self,
+        station_id: str,
+        bike_type: str,
+    ) -> Reservation:
+        """Send a reservation request for a station."""
+        response = await self._post_with_retry(
             f"{BASE_URL}/v1/last-mile/stations/reserve/v2",
-            json={
+            orjson.dumps({
                 "station_id": station_id,
                 "reservation_item_key": bike_type,
                 "is_apple_pay_authorization_needed": False,
-            },
-            headers=self._get_headers(),
+            }),
+            idempotent=False,
         )
 
         if response.status_code == 403:
@@ -361,8 +647,8 @@ class BayWheelsClient:
 
         # Parse JSON response
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise ReservationError(f"Failed to parse reservation response: {e}")
 
         ride_data = data.get("ride", {})
@@ -390,10 +676,10 @@ class BayWheelsClient:
         if not self.is_authenticated:
             raise AuthenticationError("Must be authenticated to cancel reservations")
 
-        response = await self._session.post(
+        response = await self._post_with_retry(
             f"{BASE_URL}/v1/last-mile/rides/cancel",
-            json={"ride_id": ride_id},
-            headers=self._get_headers(),
+            orjson.dumps({"ride_id": ride_id}),
+            idempotent=False,
         )
 
         if response.status_code == 403:
@@ -13,6 +13,12 @@ class AuthenticationError(BayWheelsError):
     pass
 
 
+class EmailVerificationRequiredError(AuthenticationError):
+    """Raised when login requires the account's email address to be confirmed."""
+
+    pass
+
+
 class ReservationError(BayWheelsError):
     """Raised when a reservation operation fails."""
 